@@ -1,174 +1,376 @@
 import json
 import logging
-import re
-from flask import Flask, render_template, request, jsonify
-from collections import defaultdict
-import uuid
+from flask import Flask, Response, render_template, request
+from functools import lru_cache
+from itertools import groupby
+from operator import itemgetter
 import os
-import difflib
+import pickle
+import sys
+import threading
+from types import SimpleNamespace
+import numpy as np
 
-# Setup logging with more detailed format
+# Numba is optional: when installed the /predict filter is compiled into a
+# single pass over the column slices instead of a chain of numpy masks.
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# RapidFuzz is optional: it scores fuzzy matches in C; difflib is the fallback.
+try:
+    from rapidfuzz import fuzz, process as fuzz_process
+except ImportError:
+    fuzz = None
+
+# orjson parses the multi-MB master file and encodes large /predict responses
+# several times faster than the stdlib; fall back to json when it isn't
+# installed.
+try:
+    import orjson
+    json_loads = orjson.loads
+    json_dumps = orjson.dumps
+
+    def json_dumps_pretty(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+except ImportError:
+    orjson = None
+    json_loads = json.loads
+
+    def json_dumps(obj):
+        return json.dumps(obj).encode('utf-8')
+
+    def json_dumps_pretty(obj):
+        return json.dumps(obj, indent=2)
+
+# Setup logging with more detailed format (override the level with LOG_LEVEL)
 logging.basicConfig(
-    level=logging.DEBUG,
+    level=os.environ.get('LOG_LEVEL', 'INFO').upper(),
     format='%(asctime)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s'
 )
 logger = logging.getLogger(__name__)
 
 app = Flask(__name__)
 
-# Load JSON data with detailed logging
-try:
-    logger.info("\n=== LOADING DATA ===")
-    logger.info("Attempting to load kcet_cutoffs_master.json")
-    with open('kcet_cutoffs_master.json', 'r', encoding='utf-8') as file:
-        logger.debug("File opened successfully")
-        master_data = json.load(file)
-        logger.info("JSON data loaded successfully")
-        
-        # Extract cutoff data and metadata
-        cutoff_data = master_data['cutoffs']
-        metadata = master_data['metadata']
-        
-        # Print first few entries to see the structure
-        logger.info("\n=== SAMPLE DATA ENTRIES ===")
-        for entry in cutoff_data[:3]:
-            logger.info(json.dumps(entry, indent=2))
-        
-        # Print unique values for each field
-        logger.info("\n=== UNIQUE VALUES IN DATA ===")
-        logger.info(f"Years: {sorted(set(entry['year'] for entry in cutoff_data))}")
-        logger.info(f"Categories: {sorted(set(entry['category'] for entry in cutoff_data))}")
-        logger.info(f"Rounds: {sorted(set(entry['round'] for entry in cutoff_data))}")
-        logger.info(f"Sample Courses: {sorted(set(entry['course'] for entry in cutoff_data))[:10]}")
-        logger.info("===========================\n")
-        
-        # Print counts
-        logger.info("\n=== DATA STATISTICS ===")
-        logger.info(f"Total entries: {len(cutoff_data)}")
-        logger.info(f"Unique years: {len(set(entry['year'] for entry in cutoff_data))}")
-        logger.info(f"Unique categories: {len(set(entry['category'] for entry in cutoff_data))}")
-        logger.info(f"Unique rounds: {len(set(entry['round'] for entry in cutoff_data))}")
-        logger.info(f"Unique courses: {len(set(entry['course'] for entry in cutoff_data))}")
-        logger.info("=======================\n")
-        
-        # Print available values
-        years = sorted(set(entry['year'] for entry in cutoff_data))
-        rounds = sorted(set(entry['round'] for entry in cutoff_data))
-        categories = sorted(set(entry['category'] for entry in cutoff_data))
-        courses = sorted(set(entry['course'] for entry in cutoff_data))
-        
-        logger.info("\n=== AVAILABLE DATA VALUES ===")
-        logger.info(f"Years available: {years}")
-        logger.info(f"Rounds available: {rounds}")
-        logger.info(f"Categories available: {categories}")
-        logger.info(f"Courses available: {courses}")
-        logger.info("===========================\n")
+def fast_jsonify(obj, status=200):
+    """Like flask.jsonify, but encodes with json_dumps (orjson when available)."""
+    return app.response_class(json_dumps(obj), status=status, mimetype='application/json')
+
+INDEX_SOURCE = 'kcet_cutoffs_master.json'
+# Result of _build_index(), reused while the source file is unchanged: the
+# numpy columns as .npy files for memory-mapping, everything else pickled
+INDEX_CACHE_DIR = '.kcet_cache'
+INDEX_COLUMNS = ('round_codes', 'institute_codes', 'cutoff_ranks')
+# Bump when the shape or contents of the built index change
+INDEX_CACHE_VERSION = 4
+
+# Text fields every cutoff entry must have; cutoff_rank is checked separately.
+# year must be a string too: it is sorted and hashed, and /predict matches it
+# against the year text taken from round_name
+CUTOFF_STRING_FIELDS = ('institute', 'institute_code', 'course', 'category', 'round', 'year')
+
+def _coerce_rank(value):
+    """Returns value as an int cutoff rank, or None if it isn't a usable one."""
+    if isinstance(value, str) and value.strip().isdecimal():
+        value = int(value)
+    elif isinstance(value, float) and value.is_integer():
+        value = int(value)
+    if type(value) is not int or not 0 <= value <= np.iinfo(np.int32).max:
+        return None
+    return value
+
+def _encode_column(values, ids):
+    """
+    Dictionary-encodes values to integer codes, adding unseen labels to ids.
+    Uses int16 codes whenever the number of distinct labels allows it.
+    """
+    codes = [ids.setdefault(value, len(ids)) for value in values]
+    return np.array(codes, dtype=np.int16 if len(ids) <= np.iinfo(np.int16).max else np.int32)
+
+def _build_index():
+    """
+    Loads the cutoff JSON and builds the lookup tables and columns used by
+    the routes. Returns them as a dict keyed by their module-level names.
+    """
+    # Distinct institutes by key, in first-seen order
+    institutes_by_key = {}
+
+    # Load JSON data with detailed logging
+    try:
+        logger.info("\n=== LOADING DATA ===")
+        logger.info("Attempting to load kcet_cutoffs_master.json")
+        with open(INDEX_SOURCE, 'rb') as file:
+            logger.debug("File opened successfully")
+            master_data = json_loads(file.read())
+            logger.info("JSON data loaded successfully")
         
-        # Print some sample entries
-        logger.info("\n=== SAMPLE ENTRIES ===")
-        for entry in cutoff_data[:3]:
-            logger.info(json.dumps(entry, indent=2))
-        logger.info("====================\n")
+            # Extract cutoff data
+            cutoff_data = master_data['cutoffs']
         
-        # Convert to old format for compatibility
-        data = {'kcet_cutoff': {}}
+            # Print first few entries to see the structure
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("\n=== SAMPLE DATA ENTRIES ===")
+                for entry in cutoff_data[:3]:
+                    logger.debug(json_dumps_pretty(entry))
+                logger.debug("====================\n")
         
-        # Group by year and round
-        for entry in cutoff_data:
-            year = entry['year']
-            round_name = entry['round'].lower().replace(' ', '_')
-            
-            if year not in data['kcet_cutoff']:
-                data['kcet_cutoff'][year] = {}
-            
-            if round_name not in data['kcet_cutoff'][year]:
-                data['kcet_cutoff'][year][round_name] = {}
-            
-            college_key = entry['institute_code']
-            if college_key not in data['kcet_cutoff'][year][round_name]:
-                data['kcet_cutoff'][year][round_name][college_key] = {
-                    'institute_name': entry['institute'],
-                    'institute_code': entry['institute_code'],
-                    'courses': {}
-                }
-            
-            if entry['course'] not in data['kcet_cutoff'][year][round_name][college_key]['courses']:
-                data['kcet_cutoff'][year][round_name][college_key]['courses'][entry['course']] = {}
-            
-            data['kcet_cutoff'][year][round_name][college_key]['courses'][entry['course']][entry['category']] = entry['cutoff_rank']
+            # Single pass over the raw entries: intern shared fields, collect
+            # institutes, drop duplicate rows, and gather the distinct values and
+            # round names used below
+            available_years = set()
+            available_categories = set()
+            available_rounds = set()
+            available_courses = set()
+            round_name_map = {}
+            seen_year_rounds = set()
+            seen_rows = set()
+            unique_cutoffs = []
+            rejected = []
+            for entry in cutoff_data:
+                # Validate up front so everything after works on clean rows
+                cutoff_rank = _coerce_rank(entry.get('cutoff_rank'))
+                if cutoff_rank is None or \
+                        not all(isinstance(entry.get(field), str) for field in CUTOFF_STRING_FIELDS):
+                    rejected.append(entry)
+                    continue
+                entry['cutoff_rank'] = cutoff_rank
+
+                # Low-cardinality fields repeat on every row; share one string object each
+                entry['category'] = sys.intern(entry['category'])
+                entry['course'] = sys.intern(entry['course'])
+                entry['round'] = sys.intern(entry['round'])
+                entry['institute_code'] = sys.intern(entry['institute_code'])
+
+                # Built once here rather than per row on every /predict call
+                institute_key = entry['institute_key'] = sys.intern(entry['institute_code'] + '_' + entry['institute'])
+                if institute_key not in institutes_by_key:
+                    institutes_by_key[institute_key] = {
+                        'key': institute_key,
+                        'name': entry['institute'],
+                        'code': entry['institute_code']
+                    }
+
+                # Drop duplicate rows once here instead of on every /predict call
+                row_key = (entry['institute_code'], entry['course'], entry['category'], entry['cutoff_rank'], entry['year'], entry['round'])
+                if row_key in seen_rows:
+                    continue
+                seen_rows.add(row_key)
+                unique_cutoffs.append(entry)
+
+                available_categories.add(entry['category'])
+                available_courses.add(entry['course'])
+
+                # Most entries share a (year, round) pair, so only format each pair once
+                year_round = (entry['year'], entry['round'])
+                if year_round in seen_year_rounds:
+                    continue
+                seen_year_rounds.add(year_round)
+                year, round_info = year_round
+                available_years.add(year)
+                available_rounds.add(round_info)
+                round_key = round_info.lower().replace(' ', '_')
+                round_name_map.setdefault(year, {})[round_key] = f"{year} {round_info}"
+
+            if rejected:
+                logger.warning("Skipped %d malformed cutoff entries, e.g. %s", len(rejected), rejected[:3])
+
+            logger.info("\n=== DATA STATISTICS ===")
+            logger.info("Total entries: %d (%d duplicates removed)", len(unique_cutoffs),
+                        len(cutoff_data) - len(rejected) - len(unique_cutoffs))
+            logger.info("Unique years: %d", len(available_years))
+            logger.info("Unique categories: %d", len(available_categories))
+            logger.info("Unique rounds: %d", len(available_rounds))
+            logger.info("Unique courses: %d", len(available_courses))
+            logger.info("=======================\n")
+
+            logger.info("\n=== AVAILABLE DATA VALUES ===")
+            logger.info("Years available: %s", sorted(available_years))
+            logger.info("Rounds available: %s", sorted(available_rounds))
+            logger.info("Categories available: %s", sorted(available_categories))
+            logger.info("Courses available: %s", sorted(available_courses))
+            logger.info("===========================\n")
+
+            cutoff_data = unique_cutoffs
+            del seen_rows, seen_year_rounds, unique_cutoffs
+
+            # Newest first for the year dropdown
+            years_available = sorted(available_years, reverse=True)
         
-        logger.info("Successfully converted master JSON to app format")
-        logger.debug(f"Years available: {list(data['kcet_cutoff'].keys())}")
+            logger.info("Successfully processed master JSON")
+            logger.debug("Years available: %s", years_available)
         
-except FileNotFoundError:
-    logger.error("kcet_cutoffs_master.json not found, trying original file")
-    with open('kcet_cutoffs.json', 'r', encoding='utf-8') as file:
-        data = json.load(file)
-        logger.info("Loaded original JSON file")
-except json.JSONDecodeError as e:
-    logger.error("JSON file is malformed: %s", e)
-    logger.error("Error occurred at line %d, column %d", e.lineno, e.colno)
-    raise
-except Exception as e:
-    logger.error("Unexpected error loading JSON: %s", str(e))
-    raise
-
-# Initialize institutes list
-institutes = []
-institute_set = set()
-
-# Build institutes list from cutoff data
-if 'metadata' in data and 'cutoffs' in data:
-    # New JSON format
-    logger.info("Using new JSON format with metadata")
-    cutoff_data = data['cutoffs']
-    metadata = data['metadata']
-    
-    # Extract unique institutes
-    for entry in cutoff_data:
-        institute_key = f"{entry['institute_code']}_{entry['institute']}"
-        if institute_key not in institute_set:
-            institutes.append({
-                'key': institute_key,
-                'name': entry['institute'],
-                'code': entry['institute_code']
-            })
-            institute_set.add(institute_key)
-    
-elif 'kcet_cutoff' in data:
-    # Old JSON format
-    logger.info("Using old JSON format")
-    # Extract institutes from old format
-    for year_data in data['kcet_cutoff'].values():
-        for round_data in year_data.values():
-            for college_key, college_data in round_data.items():
-                institute_key = f"{college_data['institute_code']}_{college_data['institute_name']}"
-                if institute_key not in institute_set:
-                    institutes.append({
-                        'key': institute_key,
-                        'name': college_data['institute_name'],
-                        'code': college_data['institute_code']
-                    })
-                    institute_set.add(institute_key)
+    except json.JSONDecodeError as e:
+        logger.error("JSON file is malformed: %s", e)
+        logger.error("Error occurred at line %d, column %d", e.lineno, e.colno)
+        raise
+    except Exception as e:
+        logger.error("Unexpected error loading JSON: %s", str(e))
+        raise
+
+    # Sort institutes by name
+    institutes = sorted(institutes_by_key.values(), key=lambda x: x['name'])
+    logger.info("Processed %d institutes", len(institutes))
+
+    # Column-oriented copy of the cutoffs for vectorised filtering in /predict.
+    # Rows are grouped by (year, category, course) so each group is a contiguous
+    # slice, sorted by cutoff rank within the slice so a rank window can be found
+    # with searchsorted, and string columns are dictionary-encoded to small
+    # integer codes.
+    cutoff_data.sort(key=itemgetter('year', 'category', 'course', 'cutoff_rank'))
+
+    cutoff_slices = {}
+    start = 0
+    for key, group in groupby(cutoff_data, key=itemgetter('year', 'category', 'course')):
+        stop = start + sum(1 for _ in group)
+        cutoff_slices[key] = slice(start, stop)
+        start = stop
+
+    round_ids = {}
+    institute_ids = {}
+    round_codes = _encode_column((e['round'] for e in cutoff_data), round_ids)
+    institute_codes = _encode_column((e['institute_key'] for e in cutoff_data), institute_ids)
+    cutoff_ranks = np.fromiter((e['cutoff_rank'] for e in cutoff_data), dtype=np.int32, count=len(cutoff_data))
+
+    # Labels for turning codes back into response fields. Year, category and
+    # course are the keys of cutoff_slices, so the columns and these tables are
+    # all /predict needs and the parsed row dicts aren't kept past this function.
+    round_labels = list(round_ids)
+    institute_labels = [(institutes_by_key[key]['name'], institutes_by_key[key]['code']) for key in institute_ids]
+
+    return {
+        'institutes': institutes,
+        'years_available': years_available,
+        'round_name_map': round_name_map,
+        'cutoff_slices': cutoff_slices,
+        'round_ids': round_ids,
+        'institute_ids': institute_ids,
+        'round_codes': round_codes,
+        'institute_codes': institute_codes,
+        'cutoff_ranks': cutoff_ranks,
+        'round_labels': round_labels,
+        'institute_labels': institute_labels
+    }
+
+def _index_cache_key():
+    """Identifies the current source file, or None if there is none to cache."""
+    try:
+        stat = os.stat(INDEX_SOURCE)
+    except OSError:
+        return None
+    return (INDEX_CACHE_VERSION, stat.st_mtime_ns, stat.st_size)
+
+def _index_cache_path(name, cache_key=None):
+    """Path of a cache file; column files carry the key they were built for."""
+    if cache_key is None:
+        return os.path.join(INDEX_CACHE_DIR, name)
+    return os.path.join(INDEX_CACHE_DIR, '%s-%s.npy' % (name, '-'.join(map(str, cache_key))))
+
+def _read_index_cache(cache_key):
+    """
+    Returns the cached index if it was built from the current source file.
+    The columns are memory-mapped read-only, so every worker process shares
+    the same physical pages instead of holding its own copy.
+    """
+    if cache_key is None:
+        return None
+    try:
+        with open(_index_cache_path('index.pkl'), 'rb') as file:
+            cached_key, index = pickle.load(file)
+        if cached_key != cache_key:
+            return None
+        for name in INDEX_COLUMNS:
+            index[name] = np.load(_index_cache_path(name, cache_key), mmap_mode='r')
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning("Ignoring unreadable index cache %s: %s", INDEX_CACHE_DIR, e)
+        return None
+    return index
+
+def _write_file_atomic(path, write):
+    """Writes path via a temp file and a rename so readers never see a partial file."""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as file:
+        write(file)
+    os.replace(tmp_path, path)
+
+def _write_index_cache(cache_key, index):
+    """Saves the built index for the next start; failures only cost a rebuild."""
+    if cache_key is None:
+        return
+    try:
+        os.makedirs(INDEX_CACHE_DIR, exist_ok=True)
+        column_paths = set()
+        for name in INDEX_COLUMNS:
+            path = _index_cache_path(name, cache_key)
+            _write_file_atomic(path, lambda file: np.save(file, index[name]))
+            column_paths.add(path)
+        # Written last: a matching index.pkl means its columns are complete
+        tables = {name: value for name, value in index.items() if name not in INDEX_COLUMNS}
+        _write_file_atomic(_index_cache_path('index.pkl'),
+                           lambda file: pickle.dump((cache_key, tables), file, protocol=5))
+        # Columns built from older versions of the source are no longer referenced
+        for name in os.listdir(INDEX_CACHE_DIR):
+            path = _index_cache_path(name)
+            if name.endswith('.npy') and path not in column_paths:
+                os.remove(path)
+    except OSError as e:
+        logger.warning("Could not write index cache %s: %s", INDEX_CACHE_DIR, e)
+
+RANK_MIN = int(np.iinfo(np.int64).min)
+RANK_MAX = int(np.iinfo(np.int64).max)
+
+def _filter_rows_numpy(institute_col, round_col, institute_code, selected_rounds):
+    """
+    Returns the offsets of the rows passing the institute/round filter.
+    An institute code of -1 disables the institute check.
+    """
+    mask = selected_rounds[round_col]
+    if institute_code != -1:
+        mask &= institute_col == institute_code
+    return np.flatnonzero(mask)
+
+def _filter_rows_loop(institute_col, round_col, institute_code, selected_rounds):
+    """Single-pass equivalent of _filter_rows_numpy, compiled with Numba."""
+    n_matched = 0
+    matched = np.empty(len(round_col), dtype=np.int64)
+    for i in range(len(round_col)):
+        if institute_code != -1 and institute_col[i] != institute_code:
+            continue
+        if not selected_rounds[round_col[i]]:
+            continue
+        matched[n_matched] = i
+        n_matched += 1
+    return matched[:n_matched]
+
+if njit is not None:
+    # nogil lets threaded workers filter concurrently; the slices are too
+    # small for parallel=True to win back its thread start-up cost
+    _filter_rows = njit(cache=True, nogil=True)(_filter_rows_loop)
 else:
-    logger.error("Invalid JSON structure")
-    raise ValueError("Invalid JSON structure: missing required keys")
+    _filter_rows = _filter_rows_numpy
 
-# Sort institutes by name
-institutes.sort(key=lambda x: x['name'])
-logger.info(f"Processed {len(institutes)} institutes")
+# Drops spaces and spells out '&' in one pass
+_NORM_TABLE = str.maketrans({' ': None, '&': 'and'})
 
-# Update round name mapping based on actual data
-round_name_map = defaultdict(dict)
-for entry in cutoff_data:
-    year = entry['year']
-    round_info = entry['round']
-    round_key = round_info.lower().replace(' ', '_')
-    round_name_map[year][round_key] = f"{year} {round_info}"
+# Cached because /predict keeps normalizing the same handful of labels and inputs
+@lru_cache(maxsize=4096)
+def norm(s):
+    """Normalizes a label for forgiving comparisons (case, spaces, '&')."""
+    return s.strip().lower().translate(_NORM_TABLE) if isinstance(s, str) else s
 
-logger.info("Available rounds by year:")
-for year, rounds in round_name_map.items():
-    logger.info(f"{year}: {list(rounds.values())}")
+def best_match(val, options):
+    """Returns the closest of options to val, or None if nothing is close."""
+    if fuzz is not None:
+        # processor=None: score the norm()-ed strings as-is, like difflib (RapidFuzz 2.x
+        # would otherwise strip punctuation first by default)
+        match = fuzz_process.extractOne(val, options, scorer=fuzz.ratio, processor=None, score_cutoff=60)
+        return match[0] if match else None
+    # Only reached for input that misses the exact lookups, so import on first use
+    import difflib
+    matches = difflib.get_close_matches(val, options, n=1, cutoff=0.6)
+    return matches[0] if matches else None
 
 # Update the course name mappings
 COURSE_FULL_NAMES = {
@@ -607,6 +809,130 @@ COURSE_GROUPS = {
 
 # Create reverse mapping for course names to codes
 COURSE_CODES = {full_name: code for code, full_name in COURSE_FULL_NAMES.items()}
+COURSE_CODES_NORM = {norm(full_name): code for full_name, code in COURSE_CODES.items()}
+
+# Define course groups for /get_courses
+GROUPS = {
+    'CS_IT': 'Computer Science & IT',
+    'ECE': 'Electronics & Communication',
+    'MECH': 'Mechanical & Manufacturing',
+    'CIVIL': 'Civil & Architecture',
+    'CHEM_BIO': 'Chemical & Biotechnology',
+    'AERO': 'Aerospace & Aviation',
+    'ROBOTICS': 'Robotics & Automation',
+    'OTHERS': 'Other Specialized Programs'
+}
+
+# Define courses with their groups
+COURSE_LIST = [
+    # Computer Science & IT
+    {'code': 'CS', 'name': 'Computer Science And Engineering', 'group': GROUPS['CS_IT']},
+    {'code': 'IS', 'name': 'Information Science and Technology', 'group': GROUPS['CS_IT']},
+    {'code': 'AI', 'name': 'Artificial Intelligence and Machine Learning', 'group': GROUPS['CS_IT']},
+    {'code': 'DS', 'name': 'Data Science', 'group': GROUPS['CS_IT']},
+
+    # Electronics & Communication
+    {'code': 'EC', 'name': 'Electronics and Communication Engineering', 'group': GROUPS['ECE']},
+    {'code': 'EE', 'name': 'Electrical and Electronics Engineering', 'group': GROUPS['ECE']},
+
+    # Mechanical & Manufacturing
+    {'code': 'ME', 'name': 'Mechanical Engineering', 'group': GROUPS['MECH']},
+    {'code': 'AU', 'name': 'Automobile Engineering', 'group': GROUPS['MECH']},
+
+    # Civil & Architecture
+    {'code': 'CE', 'name': 'Civil Engineering', 'group': GROUPS['CIVIL']},
+    {'code': 'AR', 'name': 'Architecture', 'group': GROUPS['CIVIL']},
+
+    # Chemical & Biotechnology
+    {'code': 'CH', 'name': 'Chemical Engineering', 'group': GROUPS['CHEM_BIO']},
+    {'code': 'BT', 'name': 'Biotechnology', 'group': GROUPS['CHEM_BIO']},
+
+    # Aerospace & Aviation
+    {'code': 'AE', 'name': 'Aeronautical Engineering', 'group': GROUPS['AERO']},
+    {'code': 'SE', 'name': 'Aerospace Engineering', 'group': GROUPS['AERO']},
+
+    # Robotics & Automation
+    {'code': 'RO', 'name': 'Robotics and Automation', 'group': GROUPS['ROBOTICS']},
+    {'code': 'RI', 'name': 'Robotics and AI', 'group': GROUPS['ROBOTICS']},
+
+    # Other Programs
+    {'code': 'MT', 'name': 'Mechatronics', 'group': GROUPS['OTHERS']},
+    {'code': 'NT', 'name': 'Nanotechnology', 'group': GROUPS['OTHERS']}
+]
+
+# Add descriptions
+for course_info in COURSE_LIST:
+    course_info['description'] = course_info['name']
+
+# The course list never changes, so encode the /get_courses payload once
+COURSES_JSON = json_dumps(COURSE_LIST)
+
+def _bootstrap():
+    """
+    Loads the cutoff index (from the cache when it is current) and builds the
+    lookup tables derived from it, returned together as one namespace. Runs
+    once per process, on the first request, so importing the module stays
+    cheap; gunicorn workers then map the shared cache files instead of each
+    parsing the JSON at import.
+    """
+    cache_key = _index_cache_key()
+    built = _read_index_cache(cache_key)
+    if built is None:
+        built = _build_index()
+        _write_index_cache(cache_key, built)
+    else:
+        logger.info("Loaded cutoff index from %s", INDEX_CACHE_DIR)
+    loaded = SimpleNamespace(**built)
+
+    # Distinct values and their normalized forms for matching /predict input
+    loaded.all_years = sorted({year for year, _, _ in loaded.cutoff_slices})
+    loaded.all_categories = sorted({category for _, category, _ in loaded.cutoff_slices})
+    loaded.all_courses = sorted({course for _, _, course in loaded.cutoff_slices})
+    loaded.all_rounds = sorted(loaded.round_ids)
+
+    loaded.norm_categories = {norm(cat): cat for cat in loaded.all_categories}
+    loaded.norm_courses = {norm(c): c for c in loaded.all_courses}
+    loaded.norm_rounds = {norm(r): r for r in loaded.all_rounds}
+    loaded.norm_category_keys = tuple(loaded.norm_categories)
+    loaded.norm_course_keys = tuple(loaded.norm_courses)
+    loaded.norm_round_keys = tuple(loaded.norm_rounds)
+
+    # Normalized form of each round code, compared against the input round as
+    # one vectorised equality per request
+    loaded.round_norms = np.array([norm(name) for name in loaded.round_labels], dtype=str)
+
+    logger.info("Available rounds by year:")
+    for year, rounds in loaded.round_name_map.items():
+        logger.info("%s: %s", year, list(rounds.values()))
+
+    if njit is not None:
+        # Compile now (for the real column dtypes) so the first prediction doesn't pay for it
+        _filter_rows(loaded.institute_codes[:0], loaded.round_codes[:0], -1, np.ones(1, dtype=bool))
+        logger.info("Using Numba-compiled filter for /predict")
+    return loaded
+
+# Everything _bootstrap() loads; None until it has run in this process
+cutoff_index = None
+# Why _bootstrap() failed, so later requests fail fast instead of rebuilding
+_bootstrap_error = None
+_bootstrap_lock = threading.Lock()
+
+@app.before_request
+def _ensure_bootstrapped():
+    """Runs _bootstrap() before the first request that needs the cutoff data."""
+    global cutoff_index, _bootstrap_error
+    # /get_courses serves a constant, so it keeps working without the data
+    if cutoff_index is not None or request.endpoint not in ('index', 'predict'):
+        return
+    with _bootstrap_lock:
+        if cutoff_index is None and _bootstrap_error is None:
+            try:
+                cutoff_index = _bootstrap()
+            except Exception as e:
+                _bootstrap_error = e
+                raise
+    if cutoff_index is None:
+        raise RuntimeError("Cutoff data failed to load; restart once it is fixed") from _bootstrap_error
 
 @app.route('/')
 def index():
@@ -614,11 +940,200 @@ def index():
     Renders the main HTML page for the KCET College Predictor.
     Passes the extracted years and institutes to the Jinja2 template.
     """
-    # Extract years from the data and sort in reverse order (newest first)
-    years = sorted(list(data['kcet_cutoff'].keys()), reverse=True)
-    logger.info(f"Passing years to template: {years}")
+    logger.info("Passing years to template: %s", cutoff_index.years_available)
+    
+    return render_template('college.html', years=cutoff_index.years_available, institutes=cutoff_index.institutes)
+
+def _call_cached(func, *args):
+    """Calls an lru_cache'd function, bypassing the cache for unhashable arguments."""
+    try:
+        hash(args)
+    except TypeError:
+        # Unhashable input (e.g. a list) can't be used as a cache key
+        return func.__wrapped__(*args)
+    return func(*args)
+
+@lru_cache(maxsize=1024)
+def _resolve_query(category_input, course_input, round_name):
+    """
+    Matches the raw category, course and round inputs against the data.
+    Returns (resolved, error): resolved is the canonical
+    (category, course, year, round_norm, round_match, is_all_rounds) tuple,
+    or error is an encoded JSON body with its status code.
+    """
+    # Match category (forgiving: normalized lookup, then closest match)
+    category_norm = norm(category_input)
+    category = cutoff_index.norm_categories.get(category_norm) or best_match(category_norm, cutoff_index.norm_category_keys)
+    if category:
+        category = cutoff_index.norm_categories.get(category, category)
+    else:
+        return None, (json_dumps({'error': f"Category '{category_input}' not found.", 'suggestions': sorted(cutoff_index.norm_category_keys)}), 400)
+    
+    # Match course
+    course_norm = norm(course_input)
+    course = cutoff_index.norm_courses.get(course_norm)
+    if not course and course_norm in COURSE_CODES_NORM:
+        # A full course name resolves to its code without fuzzy matching
+        course = cutoff_index.norm_courses.get(norm(COURSE_CODES_NORM[course_norm]))
+    course = course or best_match(course_norm, cutoff_index.norm_course_keys)
+    if course:
+        course = cutoff_index.norm_courses.get(course, course)
+    else:
+        return None, (json_dumps({'error': f"Course '{course_input}' not found.", 'suggestions': sorted(cutoff_index.norm_course_keys)}), 400)
+    
+    # Extract year and round information
+    try:
+        if ' ' not in round_name:
+            if not cutoff_index.all_years:
+                return None, (json_dumps({'error': 'No year data available'}), 400)
+            year_from_input_round_name = cutoff_index.all_years[-1]  # Latest year
+            specific_round_text_from_input = round_name
+        else:
+            parts = round_name.split(' ', 1)
+            year_from_input_round_name = parts[0]
+            specific_round_text_from_input = parts[1]
+        is_all_rounds_selected_for_year = 'all rounds' in round_name.lower()
+        input_round_norm = norm(specific_round_text_from_input)
+        round_match = cutoff_index.norm_rounds.get(input_round_norm) or best_match(input_round_norm, cutoff_index.norm_round_keys)
+        if round_match:
+            round_match = cutoff_index.norm_rounds.get(round_match, round_match)
+        else:
+            return None, (json_dumps({'error': f"Round '{specific_round_text_from_input}' not found.", 'suggestions': sorted(cutoff_index.norm_round_keys)}), 400)
+    except Exception as e:
+        logger.error("Error parsing round name '%s': %s", round_name, e)
+        return None, (json_dumps({'error': f"Invalid round format: {round_name}"}), 400)
+
+    return (category, course, year_from_input_round_name, input_round_norm, round_match,
+            is_all_rounds_selected_for_year), None
+
+@lru_cache(maxsize=1024)
+def _candidate_rows(year, category, course, input_round_norm, is_all_rounds_selected_for_year, institute_code):
+    """
+    Returns the row indices (in cutoff rank order) and ranks of the rows for
+    one year/category/course that pass the institute and round filters.
+    Nothing here depends on the rank, so requests that differ only in rank
+    share one cached candidate set and just take a different window of it.
+    institute_code is -1 for no institute filter, or None for an unknown one.
+    """
+    rows = cutoff_index.cutoff_slices.get((year, category, course), slice(0, 0))
+    if is_all_rounds_selected_for_year:
+        selected_rounds = np.ones(len(cutoff_index.round_ids), dtype=bool)
+    else:
+        selected_rounds = cutoff_index.round_norms == input_round_norm
+    if institute_code is None or not selected_rounds.any():
+        # Institute or round isn't in the data at all, so nothing can match
+        candidates = np.empty(0, dtype=np.int64)
+    else:
+        candidates = _filter_rows(cutoff_index.institute_codes[rows], cutoff_index.round_codes[rows], institute_code, selected_rounds)
+        candidates += rows.start
+    candidate_ranks = cutoff_index.cutoff_ranks[candidates]
+    # Shared between requests through the cache, so guard against in-place edits
+    candidates.flags.writeable = False
+    candidate_ranks.flags.writeable = False
+    return candidates, candidate_ranks
+
+# Entries are whole response bodies (up to a few hundred KB for an 'All
+# Rounds' query) keyed on the exact rank, so keep only a handful; the
+# rank-independent work is already shared through _candidate_rows
+@lru_cache(maxsize=256)
+def _predict_cached(rank, category, course, year_from_input_round_name, input_round_norm, round_match,
+                    is_all_rounds_selected_for_year, include_nearby, selected_institute):
+    """
+    Runs the prediction for one resolved query and returns the encoded JSON
+    body with its status code. The cutoff data never changes after startup,
+    so recent results are memoized; keying on the resolved values lets
+    differently spelled inputs share an entry.
+    """
+    # Calculate rank range based on include_nearby flag
+    rank_margin = 0.15 if include_nearby else 0  # Changed from 0.10 to 0.15 for ±15%
+    min_rank = int(rank * (1 - rank_margin))
+    max_rank = int(rank * (1 + rank_margin))
+    
+    if include_nearby:
+        # Allow ranks within ±15% range and up to 75000 ranks higher
+        rank_window = (min_rank, max_rank + 75000)
+    else:
+        # For non-nearby matches, still allow some flexibility
+        rank_window = (rank - 1000, RANK_MAX)  # Allow slightly lower ranks
+    rank_min, rank_max = (min(max(bound, RANK_MIN), RANK_MAX) for bound in rank_window)
+
+    if not selected_institute:
+        institute_code = -1
+    elif isinstance(selected_institute, str):
+        institute_code = cutoff_index.institute_ids.get(selected_institute)
+    else:
+        # Institutes are always strings in the data, so e.g. a list matches nothing
+        institute_code = None
+    candidates, candidate_ranks = _candidate_rows(year_from_input_round_name, category, course, input_round_norm,
+                                                  is_all_rounds_selected_for_year, institute_code)
+    if not len(candidates):
+        return json_dumps({'error': 'No colleges found matching your criteria.', 'debug': {
+            'year': year_from_input_round_name,
+            'category': category,
+            'course': course,
+            'round': round_match,
+            'available_years': cutoff_index.all_years,
+            'available_categories': cutoff_index.all_categories,
+            'available_courses': cutoff_index.all_courses,
+            'available_rounds': cutoff_index.all_rounds
+        }}), 404
+    
+    # Candidates are in cutoff rank order, so the rank window is a slice
+    lo = int(candidate_ranks.searchsorted(rank_min, side='left'))
+    hi = int(candidate_ranks.searchsorted(rank_max, side='right'))
+    matched = candidates[lo:max(lo, hi)]
+    if rank == 0:
+        # rank_diff is a percentage of the rank, so no row can be reported
+        matched = matched[:0]
+
+    # Slices are rank-sorted, so matches are already in cutoff rank order;
+    # putting the likely ones (cutoff_rank >= rank) first is a rotation
+    matched_ranks = cutoff_index.cutoff_ranks[matched]
+    split = int(matched_ranks.searchsorted(rank, side='left'))
+    order = np.r_[split:len(matched), 0:split]
+    matched = matched[order]
+    matched_ranks = matched_ranks[order]
+    # Percentage difference for every row at once (float64, as per-row Python division gave)
+    rank_diffs = (matched_ranks - float(rank)) / rank * 100
+    course_name = COURSE_FULL_NAMES.get(course, course)
+    matching_colleges = [
+        {
+            'institute': cutoff_index.institute_labels[institute][0],
+            'institute_code': cutoff_index.institute_labels[institute][1],
+            'cutoff_rank': cutoff_rank,
+            'course': course_name,
+            'course_code': course,
+            'category': category,
+            'round': cutoff_index.round_labels[round_id],
+            'year': year_from_input_round_name,
+            'likely': likely,
+            'rank_diff': rank_diff
+        }
+        for institute, round_id, cutoff_rank, likely, rank_diff in zip(
+            cutoff_index.institute_codes[matched].tolist(), cutoff_index.round_codes[matched].tolist(), matched_ranks.tolist(),
+            (matched_ranks >= rank).tolist(), rank_diffs.tolist())
+    ]
     
-    return render_template('college.html', years=years, institutes=institutes)
+    if not matching_colleges:
+        return json_dumps({
+            'message': 'No colleges found matching your criteria. Try adjusting your filters or including nearby ranks.',
+            'criteria': {
+                'year': year_from_input_round_name,
+                'round': round_match,
+                'is_all_rounds': is_all_rounds_selected_for_year,
+                'category': category,
+                'course': course,
+                'institute': selected_institute,
+                'rank_range': f"{min_rank} to {max_rank + 75000 if include_nearby else rank - 1000}"
+            },
+            'available_values': {
+                'years': cutoff_index.all_years,
+                'categories': cutoff_index.all_categories,
+                'rounds': cutoff_index.all_rounds
+            }
+        }), 200
+    
+    return json_dumps(matching_colleges), 200
 
 @app.route('/predict', methods=['POST'])
 def predict():
@@ -627,25 +1142,28 @@ def predict():
         
         # Log raw request data
         logger.info("Raw request data:")
-        logger.info(f"Content-Type: {request.content_type}")
-        logger.info(f"Raw data: {request.get_data(as_text=True)}")
+        logger.info("Content-Type: %s", request.content_type)
+        raw_body = request.get_data(cache=False)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Raw data: %s", raw_body.decode('utf-8', 'replace'))
         
         try:
-            user_input = request.get_json()
-            logger.info(f"Parsed JSON input: {json.dumps(user_input, indent=2)}")
+            user_input = json_loads(raw_body) if raw_body else {}
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Parsed JSON input: %s", json_dumps_pretty(user_input))
         except Exception as e:
-            logger.error(f"Failed to parse JSON: {str(e)}")
-            return jsonify({
+            logger.error("Failed to parse JSON: %s", e)
+            return fast_jsonify({
                 'error': 'Invalid JSON data',
                 'details': str(e)
-            }), 400
+            }, 400)
         
         if not user_input:
             logger.error("Empty request body")
-            return jsonify({
+            return fast_jsonify({
                 'error': 'Empty request body',
                 'help': 'Request must include rank, category, and round_name'
-            }), 400
+            }, 400)
             
         # Validate required fields
         required_fields = ['rank', 'category', 'round_name']
@@ -654,27 +1172,27 @@ def predict():
         if missing_fields:
             error_msg = f"Missing required fields: {', '.join(missing_fields)}"
             logger.error(error_msg)
-            return jsonify({
+            return fast_jsonify({
                 'error': error_msg,
                 'required_fields': required_fields,
                 'received_fields': list(user_input.keys())
-            }), 400
+            }, 400)
             
         # Log the values we received
         logger.info("Received values:")
-        logger.info(f"rank: {user_input.get('rank')}")
-        logger.info(f"category: {user_input.get('category')}")
-        logger.info(f"round_name: {user_input.get('round_name')}")
-        logger.info(f"course: {user_input.get('course', '')}")
+        logger.info("rank: %s", user_input.get('rank'))
+        logger.info("category: %s", user_input.get('category'))
+        logger.info("round_name: %s", user_input.get('round_name'))
+        logger.info("course: %s", user_input.get('course', ''))
         
         try:
             rank = int(user_input.get('rank'))
         except ValueError:
-            return jsonify({
+            return fast_jsonify({
                 'error': 'Invalid rank value',
                 'received': user_input.get('rank'),
                 'help': 'Rank must be a valid number'
-            }), 400
+            }, 400)
             
         category_input = user_input.get('category', '')
         course_input = user_input.get('course', '')
@@ -682,237 +1200,23 @@ def predict():
         include_nearby = user_input.get('include_nearby', False)
         selected_institute = user_input.get('institute', '')
 
-        # Log available values for comparison
-        logger.info("\n=== Available Values in Database ===")
-        logger.info(f"Categories: {sorted(set(entry['category'] for entry in cutoff_data))}")
-        logger.info(f"Rounds: {sorted(set(entry['round'] for entry in cutoff_data))}")
-        if course_input:
-            logger.info(f"Courses: {sorted(set(entry['course'] for entry in cutoff_data))}")
-        logger.info("================================")
-
-        # Forgiving matching for category
-        def best_match(val, options):
-            matches = difflib.get_close_matches(val, options, n=1, cutoff=0.6)
-            return matches[0] if matches else None
-        
-        # Normalize all available values for matching
-        norm = lambda s: s.strip().lower().replace(' ', '').replace('&', 'and') if isinstance(s, str) else s
-        norm_categories = {norm(cat): cat for cat in sorted(set(entry['category'] for entry in cutoff_data))}
-        norm_courses = {norm(c): c for c in sorted(set(entry['course'] for entry in cutoff_data))}
-        norm_rounds = {norm(r): r for r in sorted(set(entry['round'] for entry in cutoff_data))}
-        
-        # Match category
-        category_norm = norm(category_input)
-        category = norm_categories.get(category_norm) or best_match(category_norm, list(norm_categories.keys()))
-        if category:
-            category = norm_categories.get(category, category)
-        else:
-            return jsonify({'error': f"Category '{category_input}' not found.", 'suggestions': sorted(norm_categories.keys())}), 400
-        
-        # Match course
-        course_norm = norm(course_input)
-        course = norm_courses.get(course_norm) or best_match(course_norm, list(norm_courses.keys()))
-        if course:
-            course = norm_courses.get(course, course)
+        resolved, error = _call_cached(_resolve_query, category_input, course_input, round_name)
+        if error:
+            body, status = error
         else:
-            return jsonify({'error': f"Course '{course_input}' not found.", 'suggestions': sorted(norm_courses.keys())}), 400
-        
-        # Extract year and round information
-        try:
-            if ' ' not in round_name:
-                if not sorted(set(entry['year'] for entry in cutoff_data)):
-                    return jsonify({'error': 'No year data available'}), 400
-                year_from_input_round_name = sorted(set(entry['year'] for entry in cutoff_data))[-1]  # Latest year
-                specific_round_text_from_input = round_name
-            else:
-                parts = round_name.split(' ', 1)
-                year_from_input_round_name = parts[0]
-                specific_round_text_from_input = parts[1]
-            is_all_rounds_selected_for_year = 'all rounds' in round_name.lower()
-            input_round_norm = norm(specific_round_text_from_input)
-            round_match = norm_rounds.get(input_round_norm) or best_match(input_round_norm, list(norm_rounds.keys()))
-            if round_match:
-                round_match = norm_rounds.get(round_match, round_match)
-            else:
-                return jsonify({'error': f"Round '{specific_round_text_from_input}' not found.", 'suggestions': sorted(norm_rounds.keys())}), 400
-        except Exception as e:
-            logger.error(f"Error parsing round name '{round_name}': {str(e)}")
-            return jsonify({'error': f"Invalid round format: {round_name}"}), 400
-        
-        # Calculate rank range based on include_nearby flag
-        rank_margin = 0.15 if include_nearby else 0  # Changed from 0.10 to 0.15 for ±15%
-        min_rank = int(rank * (1 - rank_margin))
-        max_rank = int(rank * (1 + rank_margin))
-        
-        # Pre-filter the data based on year and category
-        filtered_data = []
-        for entry in cutoff_data:
-            if entry['year'] != year_from_input_round_name:
-                continue
-            if entry['category'] != category:
-                continue
-            if course and entry['course'] != course:
-                continue
-            if selected_institute and f"{entry['institute_code']}_{entry['institute']}" != selected_institute:
-                continue
-            if not is_all_rounds_selected_for_year and norm(entry['round']) != input_round_norm:
-                continue
-            filtered_data.append(entry)
-        if not filtered_data:
-            return jsonify({'error': 'No colleges found matching your criteria.', 'debug': {
-                'year': year_from_input_round_name,
-                'category': category,
-                'course': course,
-                'round': round_match,
-                'available_years': sorted(set(e['year'] for e in cutoff_data)),
-                'available_categories': sorted(set(e['category'] for e in cutoff_data)),
-                'available_courses': sorted(set(e['course'] for e in cutoff_data)),
-                'available_rounds': sorted(set(e['round'] for e in cutoff_data))
-            }}), 404
-        
-        # Filter cutoffs based on remaining criteria
-        matching_colleges = []
-        seen_combinations = set()
-        
-        for entry in filtered_data:
-            try:
-                # Handle round filtering if specific round is selected
-                if not is_all_rounds_selected_for_year:
-                    entry_round_normalized = ' '.join(entry['round'].lower().split())
-                    if entry_round_normalized != input_round_norm:
-                        continue
-
-                # Handle rank criteria with more lenient matching
-                if include_nearby:
-                    # Allow ranks within ±15% range and up to 75000 ranks higher
-                    if not (min_rank <= entry['cutoff_rank'] <= max_rank + 75000):
-                        continue
-                else:
-                    # For non-nearby matches, still allow some flexibility
-                    if entry['cutoff_rank'] < rank - 1000:  # Allow slightly lower ranks
-                        continue
-
-                # Create a unique key for this combination
-                combo_key = f"{entry['institute_code']}_{entry['course']}_{entry['category']}_{entry['cutoff_rank']}_{entry['year']}_{entry['round']}"
-                
-                if combo_key in seen_combinations:
-                    continue
-                seen_combinations.add(combo_key)
-                
-                # Calculate rank difference percentage
-                rank_diff_percent = ((entry['cutoff_rank'] - rank) / rank) * 100
-                
-                # Get full course name (use dict.get with default to avoid extra lookups)
-                course_full_name = COURSE_FULL_NAMES.get(entry['course'], entry['course'])
-                
-                matching_colleges.append({
-                    'institute': entry['institute'],
-                    'institute_code': entry['institute_code'],
-                    'cutoff_rank': entry['cutoff_rank'],
-                    'course': course_full_name,
-                    'course_code': entry['course'],
-                    'category': entry['category'],
-                    'round': entry['round'],
-                    'year': entry['year'],
-                    'likely': entry['cutoff_rank'] >= rank,
-                    'rank_diff': rank_diff_percent
-                })
-                
-            except Exception as e:
-                logger.error(f"Error processing entry: {str(e)}")
-                continue
-        
-        if not matching_colleges:
-            return jsonify({
-                'message': 'No colleges found matching your criteria. Try adjusting your filters or including nearby ranks.',
-                'criteria': {
-                    'year': year_from_input_round_name,
-                    'round': round_match,
-                    'is_all_rounds': is_all_rounds_selected_for_year,
-                    'category': category,
-                    'course': course,
-                    'institute': selected_institute,
-                    'rank_range': f"{min_rank} to {max_rank + 75000 if include_nearby else rank - 1000}"
-                },
-                'available_values': {
-                    'years': sorted(set(e['year'] for e in cutoff_data)),
-                    'categories': sorted(set(e['category'] for e in cutoff_data)),
-                    'rounds': sorted(set(e['round'] for e in cutoff_data))
-                }
-            })
-        
-        # Sort by cutoff rank and likelihood
-        matching_colleges.sort(key=lambda x: (not x['likely'], x['cutoff_rank']))
-        
-        return jsonify(matching_colleges)
+            body, status = _call_cached(_predict_cached, rank, *resolved, bool(include_nearby), selected_institute)
+        return Response(body, status=status, mimetype='application/json')
     except Exception as e:
-        logger.error(f"Unexpected error in predict route: {str(e)}", exc_info=True)
-        return jsonify({'error': f"An unexpected error occurred: {str(e)}"}), 500
+        logger.error("Unexpected error in predict route: %s", e, exc_info=True)
+        return fast_jsonify({'error': f"An unexpected error occurred: {str(e)}"}, 500)
 
 @app.route('/get_courses')
 def get_courses():
     """Returns a list of all available courses."""
-    try:
-        # Define course groups
-        GROUPS = {
-            'CS_IT': 'Computer Science & IT',
-            'ECE': 'Electronics & Communication',
-            'MECH': 'Mechanical & Manufacturing',
-            'CIVIL': 'Civil & Architecture',
-            'CHEM_BIO': 'Chemical & Biotechnology',
-            'AERO': 'Aerospace & Aviation',
-            'ROBOTICS': 'Robotics & Automation',
-            'OTHERS': 'Other Specialized Programs'
-        }
-
-        # Define courses with their groups
-        courses = [
-            # Computer Science & IT
-            {'code': 'CS', 'name': 'Computer Science And Engineering', 'group': GROUPS['CS_IT']},
-            {'code': 'IS', 'name': 'Information Science and Technology', 'group': GROUPS['CS_IT']},
-            {'code': 'AI', 'name': 'Artificial Intelligence and Machine Learning', 'group': GROUPS['CS_IT']},
-            {'code': 'DS', 'name': 'Data Science', 'group': GROUPS['CS_IT']},
-
-            # Electronics & Communication
-            {'code': 'EC', 'name': 'Electronics and Communication Engineering', 'group': GROUPS['ECE']},
-            {'code': 'EE', 'name': 'Electrical and Electronics Engineering', 'group': GROUPS['ECE']},
-
-            # Mechanical & Manufacturing
-            {'code': 'ME', 'name': 'Mechanical Engineering', 'group': GROUPS['MECH']},
-            {'code': 'AU', 'name': 'Automobile Engineering', 'group': GROUPS['MECH']},
-
-            # Civil & Architecture
-            {'code': 'CE', 'name': 'Civil Engineering', 'group': GROUPS['CIVIL']},
-            {'code': 'AR', 'name': 'Architecture', 'group': GROUPS['CIVIL']},
-
-            # Chemical & Biotechnology
-            {'code': 'CH', 'name': 'Chemical Engineering', 'group': GROUPS['CHEM_BIO']},
-            {'code': 'BT', 'name': 'Biotechnology', 'group': GROUPS['CHEM_BIO']},
-
-            # Aerospace & Aviation
-            {'code': 'AE', 'name': 'Aeronautical Engineering', 'group': GROUPS['AERO']},
-            {'code': 'SE', 'name': 'Aerospace Engineering', 'group': GROUPS['AERO']},
-
-            # Robotics & Automation
-            {'code': 'RO', 'name': 'Robotics and Automation', 'group': GROUPS['ROBOTICS']},
-            {'code': 'RI', 'name': 'Robotics and AI', 'group': GROUPS['ROBOTICS']},
-
-            # Other Programs
-            {'code': 'MT', 'name': 'Mechatronics', 'group': GROUPS['OTHERS']},
-            {'code': 'NT', 'name': 'Nanotechnology', 'group': GROUPS['OTHERS']}
-        ]
-
-        # Add descriptions
-        for course in courses:
-            course['description'] = course['name']
-
-        return jsonify(courses)
-        
-    except Exception as e:
-        logger.error(f"Error in get_courses route: {str(e)}", exc_info=True)
-        return jsonify({'error': str(e)}), 500
+    return Response(COURSES_JSON, mimetype='application/json')
 
 if __name__ == '__main__':
-    import os
+    # Load eagerly so a broken data file stops the server before it listens
+    cutoff_index = _bootstrap()
     port = int(os.environ.get('PORT', 10000))  # Use Render-provided PORT
     app.run(host='0.0.0.0', port=port)